@@ -4,6 +4,7 @@ import subprocess
 import threading
 import os
 import datetime
+import heapq
 import json
 import sys
 import requests
@@ -41,6 +42,11 @@ class HyprlandTerminal:
         self.command_history = []
         self.history_index = -1
         self.config_file = 'hyprland_terminal_config.json'
+
+        # Frecency index for directory jumping (path -> [rank, last_access, lowercase path])
+        self.dir_index = {}
+        self.dir_index_file = os.path.expanduser('~/.hyprland_terminal_dirs')
+        self.dir_index_max_score = 9000
         
         # Font settings
         self.font_family = 'JetBrainsMono Nerd Font'
@@ -49,6 +55,7 @@ class HyprlandTerminal:
 
         # Load configuration
         self.load_config()
+        self.load_dir_index()
 
         # Create GUI
         self.create_widgets()
@@ -206,6 +213,7 @@ class HyprlandTerminal:
 │    matrix   - Matrix effect
 │    tree     - File tree
 │    htop     - System monitor (fake)
+│    z        - Jump to frecent directory
 ╰─────────────────────────────────────────────────────────
 
 """
@@ -251,7 +259,7 @@ class HyprlandTerminal:
 
     def is_valid_command(self, cmd):
         """Check if command is valid"""
-        builtin_commands = ['help', 'clear', 'cd', 'exit', 'quit', 'history', 'neofetch', 'weather', 'crypto', 'matrix', 'tree', 'htop']
+        builtin_commands = ['help', 'clear', 'cd', 'exit', 'quit', 'history', 'neofetch', 'weather', 'crypto', 'matrix', 'tree', 'htop', 'z']
         return cmd in builtin_commands or self.command_exists(cmd)
 
     def command_exists(self, cmd):
@@ -293,6 +301,8 @@ class HyprlandTerminal:
             self.change_directory(command[3:].strip())
         elif command == 'cd':
             self.change_directory(os.path.expanduser("~"))
+        elif command == 'z' or command.startswith('z '):
+            self.jump_directory(command[2:].split())
         elif command == 'history':
             self.show_history()
         elif command == 'neofetch':
@@ -448,6 +458,7 @@ class HyprlandTerminal:
 │  ├─ help      - Show this help
 │  ├─ clear     - Clear terminal
 │  ├─ cd <dir>  - Change directory  
+│  ├─ z <terms> - Jump to best matching directory
 │  ├─ history   - Command history
 │  ├─ exit/quit - Exit terminal
 │  ├─ neofetch  - System information
@@ -460,7 +471,7 @@ class HyprlandTerminal:
 ├─ Features:
 │  ├─ Real-time command validation
 │  ├─ Command history (↑/↓)
-│  ├─ Tab completion
+│  ├─ Tab completion (frecent dirs after cd)
 │  ├─ Modern Hyprland styling
 │  ├─ Animated text effects
 │  └─ Thread-safe execution
@@ -500,12 +511,14 @@ class HyprlandTerminal:
                 if os.path.exists(new_path) and os.path.isdir(new_path):
                     self.current_dir = new_path
                     self.status_label.config(text=f"  {self.current_dir}")
+                    self.record_directory(new_path)
                     self.append_output(f"📁 Changed to: {self.get_short_path()}\n", self.colors['green'])
                 else:
                     self.append_output(f"❌ Directory not found: {path}\n", self.colors['red'])
             else:
                 self.current_dir = os.path.expanduser("~")
                 self.status_label.config(text=f"  {self.current_dir}")
+                self.record_directory(self.current_dir)
                 self.append_output(f"🏠 Changed to home directory\n", self.colors['green'])
 
         except Exception as e:
@@ -513,6 +526,167 @@ class HyprlandTerminal:
         
         self.show_prompt()
 
+    def jump_directory(self, terms):
+        """Jump to the most frecent directory matching terms"""
+        if not terms:
+            self.show_frecent_directories()
+            return
+
+        matches = self.match_directories(terms)
+        if matches:
+            self.change_directory(matches[0])
+            return
+
+        self.append_output(f"❌ No match for: {' '.join(terms)}\n", self.colors['red'])
+        self.show_prompt()
+
+    def show_frecent_directories(self):
+        """Show the top entries of the directory index"""
+        paths = self.match_directories([], limit=15)
+        if not paths:
+            self.append_output("No directories in index\n", self.colors['subtext'])
+            self.show_prompt()
+            return
+
+        now = time.time()
+        self.append_output("╭─ Frecent Directories\n", self.colors['green'])
+        for path in paths:
+            rank, last_access, _ = self.dir_index[path]
+            score = self.frecency(rank, last_access, now)
+            self.append_output(f"├─ {score:8.1f}  {path}\n", self.colors['text'])
+        self.append_output("╰─ End of index\n\n", self.colors['green'])
+        self.show_prompt()
+
+    def frecency(self, rank, last_access, now):
+        """Weight visit count by how recently the directory was used"""
+        age = now - last_access
+        if age < 3600:
+            return rank * 4
+        if age < 86400:
+            return rank * 2
+        if age < 604800:
+            return rank / 2
+        return rank / 4
+
+    def match_directories(self, terms, limit=1):
+        """Return up to limit existing indexed directories matching terms, best first
+
+        Terms must appear in order (case-insensitive) and the last term must
+        reach into the final path component. Missing directories are pruned.
+        """
+        terms = [term.lower() for term in terms]
+        last = terms[-1] if terms else ''
+        # The last term's match must end inside the final path component
+        overlap = len(last) - 1
+        sep = os.sep
+        now = time.time()
+        candidates = []
+
+        if not last:
+            # No terms: every entry is a candidate, including the current directory
+            candidates = [
+                (self.frecency(rank, last_access, now), path)
+                for path, (rank, last_access, _) in self.dir_index.items()
+            ]
+        else:
+            for path, (rank, last_access, lowered) in self.dir_index.items():
+                # Cheapest rejections first: the last term must be in the basename
+                if last not in lowered:
+                    continue
+                end = lowered.rfind(last)
+                if end + overlap <= lowered.rfind(sep) or path == self.current_dir:
+                    continue
+                pos = 0
+                for term in terms[:-1]:
+                    pos = lowered.find(term, pos)
+                    if pos < 0:
+                        break
+                    pos += len(term)
+                else:
+                    if pos <= end:
+                        candidates.append((self.frecency(rank, last_access, now), path))
+
+        # Only stat the candidates we hand out, pruning any that have gone away
+        matches = []
+        pruned = []
+        while candidates and len(matches) < limit:
+            top = heapq.nlargest(limit - len(matches), candidates)
+            for _, path in top:
+                if os.path.isdir(path):
+                    matches.append(path)
+                else:
+                    del self.dir_index[path]
+                    pruned.append(path)
+            if len(matches) >= limit or len(top) == len(candidates):
+                break
+            taken = set(path for _, path in top)
+            candidates = [c for c in candidates if c[1] not in taken]
+
+        if pruned:
+            # Reload so only the prune is applied on top of other windows' changes
+            self.load_dir_index()
+            for path in pruned:
+                self.dir_index.pop(path, None)
+            self.save_dir_index()
+        return matches
+
+    def record_directory(self, path):
+        """Bump a directory in the frecency index"""
+        if '\n' in path:
+            # The index is line-based, so such a path can't be stored
+            return
+
+        # Reload so only this visit is applied on top of other windows' changes
+        self.load_dir_index()
+
+        # Age the index so old entries fade out and it stays small
+        if sum(entry[0] for entry in self.dir_index.values()) > self.dir_index_max_score:
+            self.dir_index = {
+                p: [rank * 0.99, last_access, lowered]
+                for p, (rank, last_access, lowered) in self.dir_index.items()
+                if rank * 0.99 >= 1
+            }
+
+        entry = self.dir_index.get(path)
+        if entry:
+            entry[0] += 1
+            entry[1] = time.time()
+        else:
+            self.dir_index[path] = [1.0, time.time(), path.lower()]
+
+        self.save_dir_index()
+
+    def load_dir_index(self):
+        """Load directory index (one path|rank|time entry per line)
+
+        The file is the source of truth shared by every open window, so it
+        replaces the in-memory index. If it can't be read, memory is kept.
+        """
+        try:
+            dir_index = {}
+            if os.path.exists(self.dir_index_file):
+                with open(self.dir_index_file, 'r') as f:
+                    for line in f:
+                        try:
+                            path, rank, last_access = line.rstrip('\n').rsplit('|', 2)
+                            dir_index[path] = [float(rank), float(last_access), path.lower()]
+                        except ValueError:
+                            continue
+            self.dir_index = dir_index
+        except:
+            pass
+
+    def save_dir_index(self):
+        """Save directory index"""
+        try:
+            tmp_file = f"{self.dir_index_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w') as f:
+                for path, (rank, last_access, _) in self.dir_index.items():
+                    f.write(f"{path}|{rank:g}|{int(last_access)}\n")
+            os.replace(tmp_file, self.dir_index_file)
+        except:
+            pass
+
     def clear_terminal(self):
         """Clear terminal"""
         self.output_text.config(state=tk.NORMAL)
@@ -544,9 +718,36 @@ class HyprlandTerminal:
         current_text = self.command_var.get()
         cursor_pos = self.command_entry.index(tk.INSERT)
         
-        if current_text:
+        if current_text.startswith('cd ') and current_text[3:].strip():
+            # Complete from the filesystem, then add frecent directories
+            arg = current_text[3:].strip()
+            matches = self.list_subdirectories(arg)
+
+            terms = [term.rstrip(os.sep) for term in arg.split()]
+            terms = [term for term in terms if term]
+            frecent = []
+            if terms and not arg.startswith(('/', '.', '~')):
+                local = set(os.path.normpath(os.path.join(self.current_dir, m)) for m in matches)
+                frecent = [p for p in self.match_directories(terms, limit=10) if p not in local]
+
+            if frecent:
+                matches += frecent
+            else:
+                common = os.path.commonprefix(matches)
+                if len(matches) > 1 and len(common) > len(arg):
+                    matches = [common]
+
+            if len(matches) == 1:
+                self.command_var.set(f"cd {matches[0]}")
+                self.command_entry.icursor(tk.END)
+            elif matches:
+                self.append_output(f"{current_text}\n", self.colors['yellow'])
+                for path in matches:
+                    self.append_output(f"  {path}\n", self.colors['blue'])
+                self.show_prompt()
+        elif current_text:
             # Simple completion for common commands
-            commands = ['help', 'clear', 'cd', 'ls', 'pwd', 'cat', 'grep', 'find', 'neofetch', 'weather', 'crypto', 'matrix', 'tree', 'htop']
+            commands = ['help', 'clear', 'cd', 'ls', 'pwd', 'cat', 'grep', 'find', 'neofetch', 'weather', 'crypto', 'matrix', 'tree', 'htop', 'z']
             matches = [cmd for cmd in commands if cmd.startswith(current_text)]
             
             if len(matches) == 1:
@@ -555,6 +756,26 @@ class HyprlandTerminal:
         
         return "break"
 
+    def list_subdirectories(self, partial):
+        """List directories completing a partial path, as typed"""
+        head, prefix = os.path.split(partial)
+        base = os.path.expanduser(head) if head else '.'
+        if not os.path.isabs(base):
+            base = os.path.join(self.current_dir, base)
+
+        try:
+            names = sorted(os.listdir(base))
+        except OSError:
+            return []
+
+        return [
+            os.path.join(head, name) + os.sep
+            for name in names
+            if name.startswith(prefix)
+            and (prefix.startswith('.') or not name.startswith('.'))
+            and os.path.isdir(os.path.join(base, name))
+        ]
+
     def interrupt_command(self, event=None):
         """Interrupt command"""
         self.append_output("\n^C\n", self.colors['red'])